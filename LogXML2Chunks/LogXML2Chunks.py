@@ -7,14 +7,58 @@ Usage:
     python extract_test_cases.py <output.xml> [output_directory]
 """
 
-import xml.etree.ElementTree as ET
-import subprocess
+import io
 import os
+import subprocess
 import sys
-import copy
 import re
 import hashlib
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from robot import rebot
+from robot.running.context import EXECUTION_CONTEXTS
+
+# Use lxml (libxml2) for parsing and serialization when available
+try:
+    from lxml import etree as ET
+    _HAS_LXML = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML = False
+
+
+def _parse_xml(source):
+    """Parse an XML file, allowing huge text nodes (e.g. embedded screenshots) with lxml."""
+    if _HAS_LXML:
+        return ET.parse(source, ET.XMLParser(huge_tree=True))
+    return ET.parse(source)
+
+
+def _iterparse_xml(source, events):
+    """Iteratively parse an XML file, allowing huge text nodes (e.g. embedded screenshots) with lxml."""
+    if _HAS_LXML:
+        return ET.iterparse(source, events=events, huge_tree=True)
+    return ET.iterparse(source, events=events)
+
+
+# Section markers in test documentation (case-insensitive, with or without asterisks/colon)
+# Match *Steps*, *Steps:*, *Steps / Expected*, etc.
+_STEPS_RE = re.compile(r'(?:\*)?Steps(?:\s*/\s*\w+)?(?:\*)?:?', re.IGNORECASE | re.MULTILINE)
+_REQ_RE = re.compile(r'(?:\*)?Requirements(?:\*)?:?', re.IGNORECASE | re.MULTILINE)
+
+# List items in documentation sections, used with match() on stripped lines:
+# numbered (1. , 2. , etc.) or bulleted (- , * , etc.). The captured text is already stripped.
+_LIST_ITEM_RE = re.compile(r'(?:\d+\.|[-*])\s+(.+)')
+
+# First characters of lines that may continue a Steps/Requirements list
+_LIST_START_CHARS = frozenset('123456789-*')
+
+# Test statuses, interned so statuses read from XML can share these string objects
+_PASS, _FAIL, _SKIP, _UNKNOWN = map(sys.intern, ('PASS', 'FAIL', 'SKIP', 'UNKNOWN'))
+
+# Chunk index at the beginning of chunk filenames (format: idx_name_id.xml)
+_IDX_RE = re.compile(r'^(\d+)_')
 
 class LogXML2Chunks:
 
@@ -34,6 +78,8 @@ class LogXML2Chunks:
         """
         self.debug = debug
         self.filename_prefix_pattern = re.compile(filename_prefix_pattern) if filename_prefix_pattern else None
+        # Filename prefixes found in suite setups, by suite ID (reset for every split_to_chunks call)
+        self._suite_prefix_cache = {}
 
     def _debug_print(self, *args, **kwargs):
         """Print only if debug mode is enabled."""
@@ -60,14 +106,14 @@ class LogXML2Chunks:
         if not doc_text:
             return {}
 
-        steps = {}
+        # Cheap substring check before running the section regex (most docs have no Steps section)
+        if 'steps' not in doc_text.lower():
+            return {}
 
-        # Pattern to find the Steps section (case-insensitive, with or without asterisks/colon)
-        # Match *Steps*, *Steps:*, *Steps / Expected*, etc.
-        steps_pattern = r'(?:\*)?Steps(?:\s*/\s*\w+)?(?:\*)?:?'
+        steps = {}
 
         # Find the Steps section
-        match = re.search(steps_pattern, doc_text, re.IGNORECASE | re.MULTILINE)
+        match = _STEPS_RE.search(doc_text)
         if not match:
             return {}
 
@@ -97,16 +143,12 @@ class LogXML2Chunks:
 
             step_text = None
 
-            # Check for numbered list items (1. , 2. , etc.)
-            numbered_match = re.match(r'^\d+\.\s+(.+)$', line)
-            if numbered_match:
-                step_text = numbered_match.group(1).strip()
-
-            # Check for bulleted list items (- , * , etc.)
-            if not step_text:
-                bullet_match = re.match(r'^[-*]\s+(.+)$', line)
-                if bullet_match:
-                    step_text = bullet_match.group(1).strip()
+            # Check for numbered or bulleted list items, only on lines that can start one
+            first_char = line[:1]
+            if first_char.isdigit() or first_char in ('-', '*'):
+                item_match = _LIST_ITEM_RE.match(line)
+                if item_match:
+                    step_text = item_match.group(1)
 
             if step_text:
                 # Split by '/' to separate step name and expected behavior
@@ -123,7 +165,7 @@ class LogXML2Chunks:
 
             # If we already have steps and this line doesn't match any pattern,
             # it might be the end of the steps section
-            if steps and not line.startswith(('1', '2', '3', '4', '5', '6', '7', '8', '9', '-', '*')):
+            if steps and line[:1] not in _LIST_START_CHARS:
                 break
 
         return steps
@@ -145,13 +187,14 @@ class LogXML2Chunks:
         if not doc_text:
             return []
 
-        requirements = []
+        # Cheap substring check before running the section regex (most docs have no Requirements section)
+        if 'requirements' not in doc_text.lower():
+            return []
 
-        # Pattern to find the Requirements section (case-insensitive, with or without asterisks/colon)
-        requirements_pattern = r'(?:\*)?Requirements(?:\*)?:?'
+        requirements = []
 
         # Find the Requirements section
-        match = re.search(requirements_pattern, doc_text, re.IGNORECASE | re.MULTILINE)
+        match = _REQ_RE.search(doc_text)
         if not match:
             return []
 
@@ -179,16 +222,12 @@ class LogXML2Chunks:
 
             req_text = None
 
-            # Check for numbered list items (1. , 2. , etc.)
-            numbered_match = re.match(r'^\d+\.\s+(.+)$', line)
-            if numbered_match:
-                req_text = numbered_match.group(1).strip()
-
-            # Check for bulleted list items (- , * , etc.)
-            if not req_text:
-                bullet_match = re.match(r'^[-*]\s+(.+)$', line)
-                if bullet_match:
-                    req_text = bullet_match.group(1).strip()
+            # Check for numbered or bulleted list items, only on lines that can start one
+            first_char = line[:1]
+            if first_char.isdigit() or first_char in ('-', '*'):
+                item_match = _LIST_ITEM_RE.match(line)
+                if item_match:
+                    req_text = item_match.group(1)
 
             # If no list marker, treat as plain text requirement
             if not req_text and line:
@@ -200,7 +239,7 @@ class LogXML2Chunks:
 
             # If we already have requirements and this line doesn't match any pattern,
             # it might be the end of the requirements section
-            if requirements and not line.startswith(('1', '2', '3', '4', '5', '6', '7', '8', '9', '-', '*')):
+            if requirements and line[:1] not in _LIST_START_CHARS:
                 break
 
         return requirements
@@ -218,7 +257,7 @@ class LogXML2Chunks:
         try:
 
             # Parse the XML file
-            tree = ET.parse(xml_filepath)
+            tree = _parse_xml(xml_filepath)
             root = tree.getroot()
             
             # Find the suite element
@@ -239,64 +278,18 @@ class LogXML2Chunks:
                     'error': 'No test element found in XML'
                 }
             
-            # Extract test attributes
-            test_name = test.get('name', '')
-            test_id = test.get('id', '')
-            
-            # Extract test documentation if it exists
-            test_doc_element = test.find('doc')
-            test_doc = test_doc_element.text if test_doc_element is not None and test_doc_element.text else ''
-            
-            # Extract source path from suite if it exists
-            test_source = suite.get('source', '')
-            
-            # Extract steps from documentation
-            test_steps = self._extract_steps_from_documentation(test_doc)
-            
-            # Extract requirements from documentation
-            test_requirements = self._extract_requirements_from_documentation(test_doc)
-            
-            # Get test status
-            status_element = test.find('status')
-            test_status = status_element.get('status', 'UNKNOWN') if status_element is not None else 'UNKNOWN'
-            
             # Extract index from filename (format: idx_name_id.xml)
-            filename = Path(xml_filepath).name
-            idx_match = re.match(r'^(\d+)_', filename)
+            xml_path = Path(xml_filepath)
+            idx_match = _IDX_RE.match(xml_path.name)
             idx = int(idx_match.group(1)) if idx_match else 0
             
             # Check if corresponding log file exists
             log_filepath = None
-            xml_path = Path(xml_filepath)
-            log_filename = xml_path.stem + '_log.html'
-            potential_log = xml_path.parent / log_filename
+            potential_log = xml_path.parent / (xml_path.stem + '_log.html')
             if potential_log.exists():
                 log_filepath = str(potential_log)
             
-            # Calculate checksum based on test_name and documentation
-            checksum_data = f"{test_name}{test_doc}".encode('utf-8')
-            checksum = hashlib.md5(checksum_data).hexdigest()
-
-            # Build result dictionary
-            result = {
-                'index': idx,
-                'test_name': test_name,
-                'test_id': test_id,
-                'status': test_status,
-                'documentation': test_doc,
-                'steps': test_steps,
-                'requirements': test_requirements,
-                'source': test_source,
-                'xml_file': str(xml_filepath),
-                'checksum': checksum,
-                'success': True
-            }            
-
-            # Add log file if it exists
-            if log_filepath:
-                result['log_file'] = log_filepath
-            
-            return result
+            return self._build_metadata(test, suite, idx, xml_filepath, log_filepath)
             
         except ET.ParseError as e:
             return {
@@ -311,20 +304,99 @@ class LogXML2Chunks:
                 'error': f'Error reading chunk: {str(e)}'
             }
 
-    def get_data_from_chunks(self, folder_path):
+    def _build_metadata(self, test, suite, idx, xml_filepath, log_filepath=None):
+        """
+        Build the data dictionary of a single test case from its XML elements.
+
+        Used by get_data_from_chunk for chunks read from disk and by split_to_chunks
+        for tests still in memory, so both return the same structure.
+
+        Args:
+            test: Test case XML element
+            suite: Suite XML element containing the test
+            idx: Index of the test case chunk
+            xml_filepath: Path to the chunk XML file
+            log_filepath: Path to the chunk HTML log file (optional)
+
+        Returns:
+            Dictionary with test case data
+        """
+        # Extract test attributes
+        test_name = test.get('name', '')
+        test_id = test.get('id', '')
+        
+        # Extract test documentation if it exists
+        test_doc_element = test.find('doc')
+        test_doc = test_doc_element.text if test_doc_element is not None and test_doc_element.text else ''
+        
+        # Extract source path from suite if it exists
+        test_source = suite.get('source', '')
+        
+        # Extract steps from documentation
+        test_steps = self._extract_steps_from_documentation(test_doc)
+        
+        # Extract requirements from documentation
+        test_requirements = self._extract_requirements_from_documentation(test_doc)
+        
+        # Get test status (interned, so equal statuses of all chunks share one string object)
+        status_element = test.find('status')
+        test_status = sys.intern(status_element.get('status', _UNKNOWN)) if status_element is not None else _UNKNOWN
+        
+        # Calculate checksum based on test_name and documentation
+        # (fed to the hasher piece by piece, without building the concatenated string)
+        hasher = hashlib.md5(usedforsecurity=False)
+        hasher.update(test_name.encode('utf-8'))
+        hasher.update(test_doc.encode('utf-8'))
+        checksum = hasher.hexdigest()
+
+        # Build result dictionary
+        result = {
+            'index': idx,
+            'test_name': test_name,
+            'test_id': test_id,
+            'status': test_status,
+            'documentation': test_doc,
+            'steps': test_steps,
+            'requirements': test_requirements,
+            'source': test_source,
+            'xml_file': str(xml_filepath),
+            'checksum': checksum,
+            'success': True
+        }            
+
+        # Add log file if it exists
+        if log_filepath:
+            result['log_file'] = str(log_filepath)
+        
+        return result
+
+    def get_data_from_chunks(self, folder_path, max_workers=1):
         """
         Collect data from all XML chunk files in a folder.
         
         This function scans a folder for XML files, calls get_data_from_chunk 
         for each file, and returns a list of all results.
+        Chunk files are independent, so they can optionally be read in a pool of
+        worker processes. This only pays off for large numbers of chunks, and on
+        platforms starting workers with "spawn" (Windows, macOS) the calling script
+        must be guarded with ``if __name__ == '__main__':``.
         
         Args:
             folder_path: Path to the folder containing XML chunk files
+            max_workers: Number of worker processes (default: 1 = read all chunks
+                         sequentially in the current process, None = number of CPUs)
             
         Returns:
             List of dictionaries, each containing data from one chunk XML file.
             Returns empty list if folder doesn't exist or contains no XML files.
+
+        Raises:
+            ValueError: If max_workers is less than 1
         """
+        workers = (os.cpu_count() or 1) if max_workers is None else max_workers
+        if workers <= 0:
+            raise ValueError("max_workers must be greater than 0")
+
         results = []
         
         # Convert to Path object
@@ -348,10 +420,19 @@ class LogXML2Chunks:
         
         self._debug_print(f"Found {len(xml_files)} XML files in {folder_path}")
         
-        # Process each XML file
-        for xml_file in xml_files:
+        # Process XML files, in parallel worker processes if more than one is allowed
+        xml_paths = [str(xml_file) for xml_file in xml_files]
+        if workers == 1 or len(xml_paths) == 1:
+            chunks_data = [self.get_data_from_chunk(xml_path) for xml_path in xml_paths]
+        else:
+            chunksize = max(1, len(xml_paths) // (workers * 4))
+            # Workers get a copy of this instance, so subclass overrides are used there too
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_chunk_worker,
+                                     initargs=(self,)) as executor:
+                chunks_data = list(executor.map(_read_chunk, xml_paths, chunksize=chunksize))
+
+        for xml_file, chunk_data in zip(xml_files, chunks_data):
             self._debug_print(f"  Processing: {xml_file.name}")
-            chunk_data = self.get_data_from_chunk(str(xml_file))
             results.append(chunk_data)
             
             # Print status
@@ -362,7 +443,7 @@ class LogXML2Chunks:
         
         return results
 
-    def _extract_filename_prefix(self, test, suite, root=None):
+    def _extract_filename_prefix(self, test, suite, suite_by_id=None):
         """
         Extract a custom prefix for filenames from test case or suite setup messages.
         
@@ -371,56 +452,278 @@ class LogXML2Chunks:
         
         Searches in this order:
         1. Current suite's SETUP keywords
-        2. All parent suites' SETUP keywords (if root is provided)
+        2. All parent suites' SETUP keywords (if suite_by_id is provided)
         3. Test case keywords
 
+        The result of steps 1 and 2 is cached per suite ID, so tests of the same
+        suite do not search the suite setup messages again.
+
         Args:
             test: Test case XML element
             suite: Suite XML element containing the test
-            root: Root XML element (optional, for searching parent suites)
+            suite_by_id: Dictionary mapping suite IDs to suite XML elements
+                         (optional, for searching parent suites)
 
         Returns:
             Extracted prefix string (uppercase) or None if not found or pattern not set
         """
         if not self.filename_prefix_pattern:
             return None
-        
-        # Search in suite setup keywords first (current suite)
-        for msg in suite.findall('.//kw[@type="SETUP"]//msg'):
-            if msg.text:
-                match = self.filename_prefix_pattern.search(msg.text)
-                if match:
-                    return match.group(1).upper()
 
-        # Search in parent suites' SETUP keywords (if root is provided)
-        if root is not None:
-            suite_id = suite.get('id', '')
-            # Build list of parent suite IDs: s1-s1-s1-s1 -> [s1-s1-s1, s1-s1, s1]
-            parent_ids = []
-            parts = suite_id.split('-')
-            for i in range(len(parts) - 1, 0, -1):
-                parent_ids.append('-'.join(parts[:i]))
-
-            # Search in each parent suite
-            for parent_id in parent_ids:
-                parent_suite = root.find(f".//suite[@id='{parent_id}']")
-                if parent_suite is not None:
-                    for msg in parent_suite.findall('.//kw[@type="SETUP"]//msg'):
-                        if msg.text:
-                            match = self.filename_prefix_pattern.search(msg.text)
-                            if match:
-                                return match.group(1).upper()
+        # Search in suite setup keywords first (current suite, then parent suites)
+        suite_id = suite.get('id', '')
+        if suite_id not in self._suite_prefix_cache:
+            self._suite_prefix_cache[suite_id] = self._search_prefix(
+                self._iter_suite_setup_msgs(suite, suite_by_id))
+        prefix = self._suite_prefix_cache[suite_id]
+        if prefix:
+            return prefix
 
         # Search in test case keywords
-        for msg in test.findall('.//msg'):
+        return self._search_prefix(test.iter('msg'))
+
+    def _search_prefix(self, msgs):
+        """
+        Search messages for the filename prefix pattern, stopping at the first match.
+
+        Args:
+            msgs: Iterable of msg XML elements
+
+        Returns:
+            Extracted prefix string (uppercase) or None if not found
+        """
+        for msg in msgs:
             if msg.text:
                 match = self.filename_prefix_pattern.search(msg.text)
                 if match:
                     return match.group(1).upper()
-        
         return None
 
-    def split_to_chunks(self, output_xml_path, output_dir="chunked_results"):
+    def _iter_suite_setup_msgs(self, suite, suite_by_id=None):
+        """
+        Yield messages of suite SETUP keywords in filename prefix search order.
+
+        Messages of SETUP keywords anywhere in the current suite come first, then
+        messages of the parent suites' own SETUP keywords (if suite_by_id is provided),
+        closest parent first. Elements are walked lazily, so a search can stop early.
+
+        Args:
+            suite: Suite XML element
+            suite_by_id: Dictionary mapping suite IDs to suite XML elements (optional)
+
+        Yields:
+            msg XML elements
+        """
+        # Current suite
+        for kw in suite.iter('kw'):
+            if kw.get('type') == 'SETUP':
+                yield from kw.iter('msg')
+
+        if suite_by_id is None:
+            return
+
+        # Parent suites: s1-s1-s1-s1 -> s1-s1-s1, s1-s1, s1
+        parts = suite.get('id', '').split('-')
+        for i in range(len(parts) - 1, 0, -1):
+            parent_suite = suite_by_id.get('-'.join(parts[:i]))
+            if parent_suite is None:
+                continue
+            for child in parent_suite:
+                if child.tag == 'kw' and child.get('type') == 'SETUP':
+                    yield from child.iter('msg')
+
+    def _iter_suites_with_tests(self, output_xml_path):
+        """
+        Stream suites that contain test cases from output.xml.
+
+        Uses iterparse so that only the currently open suites are kept in memory
+        instead of the whole output.xml tree. A suite is yielded once its end tag
+        is parsed (setup, tests, teardown and documentation are all available)
+        and it is cleared as soon as the caller is done with it.
+
+        Args:
+            output_xml_path: Path to the output.xml file
+
+        Yields:
+            Tuples of (root, suite, parent_suites), where root is the partially parsed
+            root element and parent_suites lists the open parent suites, outermost first
+        """
+        root = None
+        open_suites = []
+
+        # Open the file here so it is closed when parsing stops early (lxml keeps it open otherwise)
+        with open(output_xml_path, 'rb') as f:
+            for event, elem in _iterparse_xml(f, events=('start', 'end')):
+                if event == 'start':
+                    if root is None:
+                        root = elem
+                    elif elem.tag == 'suite':
+                        open_suites.append(elem)
+                    continue
+
+                if elem.tag != 'suite':
+                    continue
+
+                open_suites.pop()
+                if elem.find('test') is not None:
+                    yield root, elem, open_suites
+
+                # Free the processed suite, only its parents are needed from now on
+                elem.clear()
+                (open_suites[-1] if open_suites else root).remove(elem)
+
+                # Statistics and errors after the top-level suite are not needed
+                if not open_suites:
+                    break
+
+    def _run_rebot(self, xml_filepath, log_filepath, test_name, idx):
+        """
+        Generate the HTML log of a chunk with rebot and wait for it.
+
+        Rebot runs in the current process unless a Robot Framework execution is active
+        (e.g. when called from a keyword), because in-process rebot takes over Robot
+        Framework's global output and would silence the console of the running execution.
+
+        Args:
+            xml_filepath: Path to the chunk XML file
+            log_filepath: Path to the HTML log file to generate
+            test_name: Name of the test case, used as the log name
+            idx: Index of the test case chunk
+
+        Returns:
+            Error message, or None if the log was generated
+        """
+        try:
+            if EXECUTION_CONTEXTS.current is not None:
+                process = self._start_rebot_process(xml_filepath, log_filepath, test_name)
+                _, stderr = process.communicate()
+                returncode = process.returncode
+            else:
+                # Run rebot in-process: no new interpreter and no re-import of Robot Framework per test
+                rebot_stdout = io.StringIO()
+                rebot_stderr = io.StringIO()
+                returncode = rebot(
+                    str(xml_filepath),
+                    output='NONE',
+                    log=str(log_filepath),
+                    report='NONE',
+                    name=test_name,
+                    statusrc=False,  # Don't set return code based on test status
+                    stdout=rebot_stdout,
+                    stderr=rebot_stderr
+                )
+                stderr = rebot_stderr.getvalue()
+        except Exception as e:
+            error = f"Error generating report: {str(e)}"
+            self._debug_print(f"  ✗ {error}, index number = {idx}")
+            return error
+
+        return self._check_rebot_result(returncode, stderr, log_filepath)
+
+    def _start_rebot_process(self, xml_filepath, log_filepath, test_name):
+        """
+        Start a rebot subprocess generating the HTML log of a chunk, without waiting for it.
+
+        Args:
+            xml_filepath: Path to the chunk XML file
+            log_filepath: Path to the HTML log file to generate
+            test_name: Name of the test case, used as the log name
+
+        Returns:
+            subprocess.Popen object of the started process
+        """
+        cmd = [
+            sys.executable, '-m', 'robot.rebot',
+            '--output', 'NONE',
+            '--log', str(log_filepath),
+            '--report', 'NONE',
+            '--name', test_name,
+            '--nostatusrc',  # Don't set return code based on test status
+            str(xml_filepath)
+        ]
+        return subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+
+    def _finish_rebot_process(self, process, result, log_filepath):
+        """
+        Wait for a rebot subprocess and record its outcome in the test case result.
+
+        Args:
+            process: subprocess.Popen object returned by _start_rebot_process
+            result: Test case data dictionary of the chunk
+            log_filepath: Path to the HTML log file being generated
+        """
+        _, stderr = process.communicate()
+        self._set_rebot_error(result, self._check_rebot_result(process.returncode, stderr, log_filepath))
+
+    def _check_rebot_result(self, returncode, stderr, log_filepath):
+        """
+        Check the return code of rebot and print the outcome.
+
+        Args:
+            returncode: Return code of rebot
+            stderr: Error output of rebot
+            log_filepath: Path to the generated HTML log file
+
+        Returns:
+            Error message, or None if the log was generated
+        """
+        # With statusrc disabled, rebot returns 0 on success regardless of test results
+        # Only non-zero codes indicate actual errors (invalid data, missing files, etc.)
+        if returncode == 0:
+            self._debug_print(f"  ✓ Generated log: {log_filepath}")
+            return None
+
+        error = f"Failed to generate report (exit code: {returncode})"
+        self._debug_print(f"  ✗ {error}")
+        if stderr:
+            error += f": {stderr.strip()}"
+            self._debug_print(f"     Error: {stderr}")
+        return error
+
+    def _set_rebot_error(self, result, error):
+        """
+        Mark a test case result as failed if its HTML log could not be generated.
+
+        Args:
+            result: Test case data dictionary of the chunk
+            error: Error message, or None if the log was generated
+        """
+        if error:
+            result.pop('log_file', None)
+            result['success'] = False
+            result['error'] = error
+
+    def _build_status_statistics(self, suite, test_status):
+        """
+        Build the statistics parts of a chunk that only depend on the test status.
+
+        Args:
+            suite: Suite XML element containing the test
+            test_status: Status of the test (PASS, FAIL or SKIP)
+
+        Returns:
+            Tuple of (counts, total, suite_stats): the pass/fail/skip attributes of
+            a statistics entry, the 'total' element and the 'suite' statistics element
+        """
+        counts = {
+            'pass': '1' if test_status == _PASS else '0',
+            'fail': '1' if test_status == _FAIL else '0',
+            'skip': '1' if test_status == _SKIP else '0'
+        }
+
+        total = ET.Element('total')
+        ET.SubElement(total, 'stat', counts).text = 'All Tests'
+
+        suite_stats = ET.Element('suite')
+        ET.SubElement(suite_stats, 'stat', {
+            'name': suite.get('name'),
+            'id': suite.get('id'),
+            **counts
+        })
+
+        return counts, total, suite_stats
+
+    def split_to_chunks(self, output_xml_path, output_dir="chunked_results", rebot_processes=1):
         """
         Extract each test case from output.xml into separate XML files
         and generate HTML reports using rebot.
@@ -428,151 +731,196 @@ class LogXML2Chunks:
         Args:
             output_xml_path: Path to the output.xml file
             output_dir: Directory to store extracted test results
+            rebot_processes: Number of rebot processes generating HTML reports at the same time
+                             (default: 1 = run rebot sequentially in the current process).
+                             With more than 1, rebot runs in subprocesses while the next
+                             chunks are being written.
+
+        Returns:
+            List of dictionaries with test case data (same structure as get_data_from_chunk),
+            built from the in-memory test elements. 'success' is False and 'error' is set
+            when the HTML log could not be generated.
+            output.xml is processed while it is being parsed, so if it turns out to be truncated
+            or malformed (e.g. the Robot Framework run was killed), the chunks of the suites read
+            before the error are kept and a last entry with 'xml_file' (the output.xml path),
+            'success' False and 'error' is appended.
         """
+        results = []
+
         # Create output directory if it doesn't exist
         output_path = Path(output_dir)
         output_path.mkdir(exist_ok=True)
 
-        # Parse the XML file
-        tree = ET.parse(output_xml_path)
-        root = tree.getroot()
-
-        # Find all test cases
-        test_cases = []
-        for suite in root.findall('.//suite'):
-            for test in suite.findall('test'):
-                test_cases.append((suite, test))
-
-        self._debug_print(f"Found {len(test_cases)} test cases")
+        # Stream the XML file suite by suite and extract each test case
+        idx = 0
+        self._suite_prefix_cache = {}
+        # rebot subprocesses still running (rebot_processes > 1): (process, result, log_filepath)
+        running = deque()
+        try:
+            for root, suite, parent_suites in self._iter_suites_with_tests(output_xml_path):
+                # Suite parts shared by all its tests. They are appended to each chunk as they are,
+                # without copying: a chunk is written out before the next one is built and only
+                # whitespace (indentation) of these elements is ever touched. With lxml, appending
+                # moves an element from the previous chunk to the next one, which is fine as well.
+                # The suite children are classified in a single pass.
+                sources, setups, tests, teardowns, docs = [], [], [], [], []
+                for child in suite:
+                    tag = child.tag
+                    if tag == 'test':
+                        tests.append(child)
+                    elif tag == 'kw':
+                        kw_type = child.get('type')
+                        if kw_type == 'SETUP':
+                            setups.append(child)
+                        elif kw_type == 'TEARDOWN':
+                            teardowns.append(child)
+                    elif tag == 'source':
+                        sources.append(child)
+                    elif tag == 'doc':
+                        docs.append(child)
+
+                # Parent suites by ID, for the filename prefix lookup
+                suite_by_id = {parent.get('id'): parent for parent in parent_suites}
+
+                # Statistics elements of the suite's chunks, by test status
+                status_stats = {}
+
+                for test in tests:
+                    idx += 1
+                    test_name = test.get('name')
+                    test_id = test.get('id')
+
+                    # Extract filename prefix (if pattern is configured). Suite setups are only searched
+                    # for the first test, while the suite is intact (lxml moves elements into chunks).
+                    prefix = self._extract_filename_prefix(test, suite, suite_by_id)
+
+                    # Create a safe filename (with prefix if available)
+                    safe_name = test_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
+                    if prefix:
+                        xml_filename = f"{idx}_{prefix}_{safe_name}_{test_id}.xml"
+                    else:
+                        xml_filename = f"{idx}_{safe_name}_{test_id}.xml"
+                    xml_filepath = output_path / xml_filename
+
+                    if prefix:
+                        self._debug_print(f"\n[{idx}] Processing: {test_name} (Prefix: {prefix})")
+                    else:
+                        self._debug_print(f"\n[{idx}] Processing: {test_name}")
+
+                    # Create a new XML document with only this test case
+                    new_root = ET.Element('robot', dict(root.attrib))
+
+                    # Create a new suite element with the test case
+                    new_suite = ET.SubElement(new_root, 'suite', dict(suite.attrib))
+
+                    # Add suite source if it exists
+                    for source in sources:
+                        new_suite.append(source)
+
+                    # Add suite setup if exists
+                    for setup in setups:
+                        new_suite.append(setup)
+
+                    # Add the test case
+                    new_suite.append(test)
+
+                    # Add suite teardown if exists
+                    for teardown in teardowns:
+                        new_suite.append(teardown)
+
+                    # Add suite documentation if exists
+                    for doc in docs:
+                        new_suite.append(doc)
+
+                    # Don't copy suite status - it will be recalculated by rebot based on test status
+
+                    # Add statistics
+                    stats = ET.SubElement(new_root, 'statistics')
+
+                    # Total and suite statistics only depend on the test status, so they are built
+                    # once per status and shared by the suite's chunks, like the suite parts above
+                    test_status = test.find('status').get('status')
+                    if test_status not in status_stats:
+                        status_stats[test_status] = self._build_status_statistics(suite, test_status)
+                    counts, total, suite_stats = status_stats[test_status]
+
+                    # Total statistics
+                    stats.append(total)
+
+                    # Tag statistics
+                    tag_stats = ET.SubElement(stats, 'tag')
+                    for tag in test.findall('tag'):
+                        ET.SubElement(tag_stats, 'stat', counts).text = tag.text
+
+                    # Suite statistics
+                    stats.append(suite_stats)
+
+                    # Add errors element (empty)
+                    ET.SubElement(new_root, 'errors')
+
+                    # Write the XML file
+                    # (rebot ignores whitespace, so pretty-printing is only done in debug mode)
+                    if self.debug:
+                        ET.indent(new_root, space='  ')
+                    xml_filepath.write_bytes(ET.tostring(new_root, encoding='UTF-8', xml_declaration=True))
+
+                    self._debug_print(f"  ✓ Created XML: {xml_filepath}")
+
+                    # Generate HTML report using rebot
+                    if prefix:
+                        log_filename = f"{idx}_{prefix}_{safe_name}_{test_id}_log.html"
+                    else:
+                        log_filename = f"{idx}_{safe_name}_{test_id}_log.html"
+                    log_filepath = output_path / log_filename
+
+                    # Build test case data from the in-memory elements instead of parsing the chunk again
+                    result = self._build_metadata(test, suite, idx, xml_filepath, log_filepath)
+                    results.append(result)
+
+                    if rebot_processes > 1:
+                        # Wait for the oldest rebot process when the limit of running processes is reached
+                        if len(running) >= rebot_processes:
+                            self._finish_rebot_process(*running.popleft())
+                        try:
+                            process = self._start_rebot_process(xml_filepath, log_filepath, test_name)
+                        except Exception as e:
+                            error = f"Error generating report: {str(e)}"
+                            self._debug_print(f"  ✗ {error}, index number = {idx}")
+                            self._set_rebot_error(result, error)
+                        else:
+                            running.append((process, result, log_filepath))
+                    else:
+                        self._set_rebot_error(result, self._run_rebot(xml_filepath, log_filepath, test_name, idx))
+        except ET.ParseError as e:
+            error = f'XML parsing error: {str(e)}'
+            self._debug_print(f"\n✗ {error}")
+            results.append({
+                'xml_file': str(output_xml_path),
+                'success': False,
+                'error': error
+            })
+        finally:
+            # Wait for the remaining rebot processes
+            while running:
+                self._finish_rebot_process(*running.popleft())
 
-        # Extract each test case
-        for idx, (suite, test) in enumerate(test_cases, 1):
-            test_name = test.get('name')
-            test_id = test.get('id')
-            
-            # Extract filename prefix (if pattern is configured)
-            prefix = self._extract_filename_prefix(test, suite, root)
+        self._debug_print(f"\nProcessed {idx} test cases")
 
-            # Create a safe filename (with prefix if available)
-            safe_name = test_name.replace(' ', '_').replace('/', '_').replace('\\', '_')
-            if prefix:
-                xml_filename = f"{idx}_{prefix}_{safe_name}_{test_id}.xml"
-            else:
-                xml_filename = f"{idx}_{safe_name}_{test_id}.xml"
-            xml_filepath = output_path / xml_filename
+        return results
 
-            if prefix:
-                self._debug_print(f"\n[{idx}/{len(test_cases)}] Processing: {test_name} (Prefix: {prefix})")
-            else:
-                self._debug_print(f"\n[{idx}/{len(test_cases)}] Processing: {test_name}")
-
-            # Create a new XML document with only this test case
-            new_root = ET.Element('robot', root.attrib)
-
-            # Create a new suite element with the test case
-            new_suite = ET.SubElement(new_root, 'suite')
-            new_suite.attrib = suite.attrib.copy()
-
-            # Copy suite source if it exists
-            for source in suite.findall('source'):
-                new_suite.append(copy.deepcopy(source))
-
-            # Copy suite setup if exists (use deepcopy to avoid moving elements)
-            for setup in suite.findall('kw[@type="SETUP"]'):
-                new_suite.append(copy.deepcopy(setup))
-
-            # Add the test case (use deepcopy to avoid moving the element)
-            new_suite.append(copy.deepcopy(test))
-
-            # Copy suite teardown if exists (use deepcopy to avoid moving elements)
-            for teardown in suite.findall('kw[@type="TEARDOWN"]'):
-                new_suite.append(copy.deepcopy(teardown))
-
-            # Copy suite documentation if exists
-            for doc in suite.findall('doc'):
-                new_suite.append(copy.deepcopy(doc))
-
-            # Don't copy suite status - it will be recalculated by rebot based on test status
-
-            # Add statistics
-            stats = ET.SubElement(new_root, 'statistics')
-
-            # Total statistics
-            total = ET.SubElement(stats, 'total')
-            test_status = test.find('status').get('status')
-            pass_count = '1' if test_status == 'PASS' else '0'
-            fail_count = '1' if test_status == 'FAIL' else '0'
-            skip_count = '1' if test_status == 'SKIP' else '0'
-
-            ET.SubElement(total, 'stat', {
-                'pass': pass_count,
-                'fail': fail_count,
-                'skip': skip_count
-            }).text = 'All Tests'
-
-            # Tag statistics
-            tag_stats = ET.SubElement(stats, 'tag')
-            for tag in test.findall('tag'):
-                ET.SubElement(tag_stats, 'stat', {
-                    'pass': pass_count,
-                    'fail': fail_count,
-                    'skip': skip_count
-                }).text = tag.text
-
-            # Suite statistics
-            suite_stats = ET.SubElement(stats, 'suite')
-            ET.SubElement(suite_stats, 'stat', {
-                'name': suite.get('name'),
-                'id': suite.get('id'),
-                'pass': pass_count,
-                'fail': fail_count,
-                'skip': skip_count
-            })
 
-            # Add errors element (empty)
-            ET.SubElement(new_root, 'errors')
+# Chunk reader of a get_data_from_chunks worker process, created once per process
+_worker_chunker = None
 
-            # Write the XML file
-            new_tree = ET.ElementTree(new_root)
-            ET.indent(new_tree, space='  ')
-            new_tree.write(xml_filepath, encoding='UTF-8', xml_declaration=True)
 
-            self._debug_print(f"  ✓ Created XML: {xml_filepath}")
+def _init_chunk_worker(chunker):
+    """Set up the chunk reader used by a get_data_from_chunks worker process."""
+    global _worker_chunker
+    # Progress is printed by the parent process, not by the workers
+    chunker.debug = False
+    _worker_chunker = chunker
 
-            # Generate HTML report using rebot
-            if prefix:
-                log_filename = f"{idx}_{prefix}_{safe_name}_{test_id}_log.html"
-            else:
-                log_filename = f"{idx}_{safe_name}_{test_id}_log.html"
-            log_filepath = output_path / log_filename
-
-            try:
-                cmd = [
-                    'rebot',
-                    '--output', 'NONE',
-                    '--log', str(log_filepath),
-                    '--name', test_name,
-                    '--NoStatusRC',  # Don't set return code based on test status
-                    str(xml_filepath)
-                ]
-
-                result = subprocess.run(
-                    cmd,
-                    capture_output=True,
-                    text=True,
-                    check=False
-                )
 
-                # With --NoStatusRC, rebot returns 0 on success regardless of test results
-                # Only non-zero codes indicate actual errors (invalid data, missing files, etc.)
-                if result.returncode == 0:
-                    self._debug_print(f"  ✓ Generated log: {log_filepath}")
-                else:
-                    self._debug_print(f"  ✗ Failed to generate report (exit code: {result.returncode})")
-                    if result.stderr:
-                        self._debug_print(f"     Error: {result.stderr}")
-
-            except FileNotFoundError:
-                self._debug_print(f"  ✗ Error: rebot command not found. Please install robotframework.")
-            except Exception as e:
-                self._debug_print(f"  ✗ Error generating report: {str(e)}, index number = {idx}")
+def _read_chunk(xml_filepath):
+    """Read a single chunk XML file in a get_data_from_chunks worker process."""
+    return _worker_chunker.get_data_from_chunk(xml_filepath)
@@ -91,7 +91,10 @@ Examples:
             print(f"\nDetailed Results:")
             for result in results:
                 status_icon = "✓" if result['success'] else "✗"
-                print(f"  {status_icon} [{result['index']}] {result['test_name']} - {result['status']}")
+                if 'index' in result:
+                    print(f"  {status_icon} [{result['index']}] {result['test_name']} - {result['status']}")
+                else:
+                    print(f"  {status_icon} {result['xml_file']}")
                 if not result['success']:
                     print(f"      Error: {result.get('error', 'Unknown error')}")
         
@@ -24,8 +24,6 @@ setup(
         'Topic :: Software Development :: Testing',
         'License :: OSI Approved :: MIT License',
         'Programming Language :: Python :: 3',
-        'Programming Language :: Python :: 3.7',
-        'Programming Language :: Python :: 3.8',
         'Programming Language :: Python :: 3.9',
         'Programming Language :: Python :: 3.10',
         'Programming Language :: Python :: 3.11',
@@ -33,11 +31,14 @@ setup(
         'Framework :: Robot Framework :: Library',
     ],
     keywords='robotframework testing automation xml log chunks',
-    python_requires='>=3.7',
+    python_requires='>=3.9',
     install_requires=[
         'robotframework>=4.0',
     ],
     extras_require={
+        'lxml': [
+            'lxml>=4.5',
+        ],
         'dev': [
             'pytest>=7.0',
             'pytest-cov>=4.0',
@@ -2,10 +2,60 @@
 Unit tests for LogXML2Chunks library.
 """
 import pytest
+import hashlib
+import importlib
+import io
+import xml.etree.ElementTree
 from pathlib import Path
+import robot
 from LogXML2Chunks import LogXML2Chunks
-import tempfile
-import shutil
+
+EXAMPLE_LOGS = Path(__file__).parent / 'example_logs'
+PREFIX_PATTERN = r"open_session\('(\w+)'"
+
+
+def run_robot(source, output_dir):
+    """Execute Robot Framework test data and return the path of the generated output.xml."""
+    output_dir.mkdir(parents=True, exist_ok=True)
+    robot.run(str(source), outputdir=str(output_dir), log='NONE', report='NONE',
+              stdout=io.StringIO(), stderr=io.StringIO())
+    output_xml = output_dir / 'output.xml'
+    assert output_xml.exists(), f"Robot Framework did not generate {output_xml}"
+    return output_xml
+
+
+@pytest.fixture(scope='module')
+def example_output(tmp_path_factory):
+    """output.xml generated from example.robot."""
+    return run_robot(EXAMPLE_LOGS / 'example.robot', tmp_path_factory.mktemp('example'))
+
+
+@pytest.fixture(scope='module')
+def nested_output(tmp_path_factory):
+    """output.xml of a nested suite with suite setups in the parent and in a child suite."""
+    return run_robot(EXAMPLE_LOGS / 'nested', tmp_path_factory.mktemp('nested'))
+
+
+@pytest.fixture(params=['lxml', 'xml.etree'])
+def xml_backend(request, monkeypatch):
+    """Run a test with both supported XML backends."""
+    module = importlib.import_module('LogXML2Chunks.LogXML2Chunks')
+    if request.param == 'lxml':
+        pytest.importorskip('lxml')
+        assert module._HAS_LXML, "lxml is installed but not used"
+    else:
+        monkeypatch.setattr(module, 'ET', xml.etree.ElementTree)
+        monkeypatch.setattr(module, '_HAS_LXML', False)
+    return request.param
+
+
+class TaggingChunker(LogXML2Chunks):
+    """LogXML2Chunks subclass marking the data it reads from chunks."""
+
+    def get_data_from_chunk(self, xml_filepath):
+        result = super().get_data_from_chunk(xml_filepath)
+        result['tagged'] = True
+        return result
 
 
 class TestLogXML2Chunks:
@@ -62,6 +112,10 @@ class TestLogXML2Chunks:
         assert isinstance(result['checksum'], str), "checksum should be a string"
         assert len(result['checksum']) == 32, f"checksum should be 32 characters (MD5), got {len(result['checksum'])}"
         assert result['checksum'].isalnum(), "checksum should be alphanumeric"
+        # Stored checksums must stay valid: MD5 of test_name + documentation
+        expected_checksum = hashlib.md5((result['test_name'] + result['documentation']).encode('utf-8')).hexdigest()
+        assert result['checksum'] == expected_checksum, f"Expected MD5 {expected_checksum}, got {result['checksum']}"
+        assert result['checksum'] == '57a832680ec9e9fd27976262280d2704'
         
         # Verify source path
         assert 'example.robot' in result['source'], f"Source should contain 'example.robot', got '{result['source']}'"
@@ -91,6 +145,21 @@ class TestLogXML2Chunks:
         print(f"  Steps: {result['steps']}")
         print(f"  Source: {result['source']}")
     
+    def test_extract_from_documentation_line_breaks(self):
+        """Test that documentation sections are split only on newlines, CRLF included."""
+        chunker = LogXML2Chunks(debug=False)
+
+        assert chunker._extract_steps_from_documentation(
+            '*Steps*\r\n- Open page / opens\r\n- Click / ok\r\n') == {'Open page': 'opens', 'Click': 'ok'}
+        assert chunker._extract_requirements_from_documentation(
+            '*Requirements*\r\n- REQ-1\r\n- REQ-2\r\n') == ['REQ-1', 'REQ-2']
+
+        # Other characters str.splitlines() would break on are kept inside the line
+        assert chunker._extract_steps_from_documentation(
+            '*Steps*\n- Open page / opens\x0c- Click / ok') == {'Open page': 'opens\x0c- Click / ok'}
+        assert chunker._extract_requirements_from_documentation(
+            '*Requirements*\n- REQ-1 \r- REQ-2') == ['REQ-1 \r- REQ-2']
+
     def test_get_data_from_chunks(self):
         """Test collecting data from all XML chunk files in a folder.
         
@@ -143,28 +212,120 @@ class TestLogXML2Chunks:
         print(f"  Failed: {len(results) - len(successful)}")
         for idx, result in enumerate(successful, 1):
             print(f"  [{idx}] {result['test_name']} - {result['status']}")
-    
-    def test_split_to_chunks(self):
+
+    def test_get_data_from_chunks_parallel(self):
+        """Test that reading chunks in worker processes gives the same results as sequential reading."""
+        chunker = LogXML2Chunks(debug=False)
+        chunks_folder = Path(__file__).parent / 'example_logs' / 'chunks'
+
+        sequential = chunker.get_data_from_chunks(str(chunks_folder), max_workers=1)
+        parallel = chunker.get_data_from_chunks(str(chunks_folder), max_workers=2)
+
+        assert len(sequential) == 4, f"Expected 4 chunks, got {len(sequential)}"
+        assert parallel == sequential, "Parallel results should match sequential results"
+
+    @pytest.mark.parametrize('max_workers', [0, -1])
+    def test_get_data_from_chunks_invalid_max_workers(self, max_workers):
+        """Test that a number of worker processes below 1 is rejected."""
+        chunker = LogXML2Chunks(debug=False)
+        chunks_folder = Path(__file__).parent / 'example_logs' / 'chunks'
+
+        with pytest.raises(ValueError, match='max_workers must be greater than 0'):
+            chunker.get_data_from_chunks(str(chunks_folder), max_workers=max_workers)
+
+    def test_get_data_from_chunks_parallel_subclass(self):
+        """Test that worker processes use the overrides of a LogXML2Chunks subclass."""
+        chunker = TaggingChunker(debug=False)
+        chunks_folder = Path(__file__).parent / 'example_logs' / 'chunks'
+
+        results = chunker.get_data_from_chunks(str(chunks_folder), max_workers=2)
+
+        assert len(results) == 4, f"Expected 4 chunks, got {len(results)}"
+        assert all(result['tagged'] for result in results), "Subclass override should be used in workers"
+
+    def test_split_to_chunks(self, example_output, xml_backend, tmp_path):
         """Test splitting Robot Framework output.xml into separate test chunks.
         
         This test:
-        1. Loads an example output.xml file
-        2. Splits it into individual test case chunks
-        3. Verifies that chunks are created correctly
-        4. Checks that each chunk contains the expected data
+        1. Splits an output.xml generated from example.robot into individual test case chunks
+        2. Verifies that chunks are created correctly
+        3. Checks that each chunk contains the expected data
         """
         # Setup
         chunker = LogXML2Chunks()
-        example_log = Path(__file__).parent / 'example_logs' / 'output.xml'
-        
-        # Verify the example log exists
-        assert example_log.exists(), f"Example log not found at {example_log}"
-        
-        # Create a temporary directory for output
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_dir = Path(temp_dir) / 'chunks'        
-            # Execute the split
-            chunker.split_to_chunks(str(example_log), str(output_dir))            
+        output_dir = tmp_path / 'chunks'
+
+        # Execute the split
+        results = chunker.split_to_chunks(str(example_output), str(output_dir))
+
+        # Verify one successful result per test case
+        assert len(results) == 4, f"Expected 4 results, got {len(results)}"
+        for result in results:
+            assert result['success'] is True, f"Split should succeed, got error: {result.get('error', 'N/A')}"
+            assert Path(result['xml_file']).exists(), f"Chunk XML should exist: {result['xml_file']}"
+            assert Path(result['log_file']).exists(), f"Chunk log should exist: {result['log_file']}"
+
+        # Verify returned data matches the data read back from the chunk files
+        assert results == chunker.get_data_from_chunks(str(output_dir), max_workers=1)
+
+    def test_split_to_chunks_nested(self, nested_output, xml_backend, tmp_path):
+        """Test filename prefixes and order of chunks from nested suites with suite setups.
+
+        Tests of the first child suite get the prefix logged in the setup of the parent suite,
+        tests of the second child suite the prefix logged in their own suite setup.
+        """
+        chunker = LogXML2Chunks(debug=False, filename_prefix_pattern=PREFIX_PATTERN)
+        output_dir = tmp_path / 'chunks'
+
+        results = chunker.split_to_chunks(str(nested_output), str(output_dir))
+
+        assert [Path(result['xml_file']).name for result in results] == [
+            '1_TOP_First_Test_1_s1-s1-t1.xml',
+            '2_TOP_First_Test_2_s1-s1-t2.xml',
+            '3_DB_Second_Test_1_s1-s2-t1.xml',
+            '4_DB_Second_Test_2_s1-s2-t2.xml',
+        ]
+        assert [result['status'] for result in results] == ['PASS', 'PASS', 'PASS', 'FAIL']
+        assert all(result['success'] for result in results), "Split should succeed for all tests"
+        assert results == chunker.get_data_from_chunks(str(output_dir), max_workers=1)
+
+    def test_split_to_chunks_truncated_output(self, nested_output, xml_backend, tmp_path):
+        """Test that a truncated output.xml keeps the chunks read so far and reports the parse error."""
+        chunker = LogXML2Chunks(debug=False, filename_prefix_pattern=PREFIX_PATTERN)
+        # Cut output.xml right after the first child suite, as if the run had been killed
+        data = nested_output.read_bytes()
+        truncated_xml = tmp_path / 'output.xml'
+        truncated_xml.write_bytes(data[:data.index(b'</suite>') + len(b'</suite>')])
+        output_dir = tmp_path / 'chunks'
+
+        results = chunker.split_to_chunks(str(truncated_xml), str(output_dir))
+
+        assert len(results) == 3, f"Expected 2 chunks and a parse error, got {len(results)} results"
+        for result in results[:2]:
+            assert result['success'] is True, f"Split should succeed, got error: {result.get('error', 'N/A')}"
+            assert Path(result['xml_file']).exists(), f"Chunk XML should exist: {result['xml_file']}"
+            assert Path(result['log_file']).exists(), f"Chunk log should exist: {result['log_file']}"
+        assert results[2]['success'] is False
+        assert results[2]['xml_file'] == str(truncated_xml)
+        assert results[2]['error'].startswith('XML parsing error: ')
+
+    def test_split_to_chunks_rebot_processes(self, example_output, xml_backend, tmp_path, monkeypatch):
+        """Test that generating logs in rebot subprocesses gives the same chunks as in-process rebot."""
+        chunker = LogXML2Chunks(debug=False)
+        # rebot writes its default report to the working directory unless disabled
+        monkeypatch.chdir(tmp_path)
+
+        results = chunker.split_to_chunks(str(example_output), str(tmp_path / 'in_process'))
+        subprocess_results = chunker.split_to_chunks(str(example_output), str(tmp_path / 'subprocesses'),
+                                                     rebot_processes=2)
+
+        assert len(subprocess_results) == 4, f"Expected 4 results, got {len(subprocess_results)}"
+        for result in subprocess_results:
+            assert result['success'] is True, f"Split should succeed, got error: {result.get('error', 'N/A')}"
+            assert Path(result['log_file']).exists(), f"Chunk log should exist: {result['log_file']}"
+        assert not (tmp_path / 'report.html').exists(), "rebot should not generate a report"
+        assert [Path(result['log_file']).name for result in subprocess_results] == \
+            [Path(result['log_file']).name for result in results]
 
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])